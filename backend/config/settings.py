@@ -5,10 +5,70 @@
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
+# 默认 .env 是否已经加载过（避免重复构造 Settings 时反复读盘解析）
+_dotenv_loaded = False
+
+
+def _to_bool(value: Optional[str], default: bool) -> bool:
+    """
+    环境变量字符串转布尔值
+
+    :param value: 环境变量原始值
+    :param default: 默认值
+    :return: 布尔值
+    """
+    if value is None:
+        return default
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _to_int(value: Optional[str], default: int) -> int:
+    """
+    环境变量字符串转整数
+
+    :param value: 环境变量原始值
+    :param default: 默认值
+    :return: 整数值
+    """
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _to_str(value: Optional[str], default: str) -> str:
+    """
+    环境变量字符串，缺省时取默认值
+
+    :param value: 环境变量原始值
+    :param default: 默认值
+    :return: 字符串值
+    """
+    return default if value is None else value
+
+
+# 类型 -> 转换函数的分发表
+_COERCE = {bool: _to_bool, int: _to_int, str: _to_str}
+
+# 基础配置schema: (配置名, 类型, 默认值)，__init__ 中单次循环完成全部读取
+_SCHEMA = (
+    ('DEBUG', bool, False),
+    ('LOG_LEVEL', str, 'INFO'),
+    ('OUTPUT_DIR', str, '.'),
+    ('DEFAULT_DELAY', int, 1),
+    ('DEFAULT_TIMEOUT', int, 30),
+    ('MAX_RETRIES', int, 3),
+    ('CLEANUP_DAYS', int, 30),
+    ('MAX_FILE_SIZE', int, 10 * 1024 * 1024),  # 10MB
+)
+
 
 class Settings:
     """
@@ -22,65 +82,39 @@ class Settings:
         
         :param config_file: 配置文件路径
         """
-        # 加载环境变量
+        # 加载环境变量（默认 .env 只在首次构造时解析一次）
+        global _dotenv_loaded
         if config_file and Path(config_file).exists():
             load_dotenv(config_file)
-        else:
+        elif not _dotenv_loaded:
             load_dotenv()
+            _dotenv_loaded = True
         
-        # 基础配置
-        self.DEBUG = self._get_bool_env('DEBUG', False)
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
-        self.OUTPUT_DIR = os.getenv('OUTPUT_DIR', '.')
-        
-        # 抓取配置
-        self.DEFAULT_DELAY = self._get_int_env('DEFAULT_DELAY', 1)
-        self.DEFAULT_TIMEOUT = self._get_int_env('DEFAULT_TIMEOUT', 30)
-        self.MAX_RETRIES = self._get_int_env('MAX_RETRIES', 3)
-        
-        # 文件管理配置
-        self.CLEANUP_DAYS = self._get_int_env('CLEANUP_DAYS', 30)
-        self.MAX_FILE_SIZE = self._get_int_env('MAX_FILE_SIZE', 10 * 1024 * 1024)  # 10MB
-        
+        # 基础配置：schema驱动，一次循环读完全部环境变量
+        env = os.environ
+        for name, typ, default in _SCHEMA:
+            setattr(self, name, _COERCE[typ](env.get(name), default))
+
         # 抓取器配置
-        self.CRAWLER_CONFIGS = self._load_crawler_configs()
-    
-    def _get_bool_env(self, key: str, default: bool) -> bool:
-        """
-        获取布尔类型环境变量
-        
-        :param key: 环境变量键
-        :param default: 默认值
-        :return: 布尔值
-        """
-        value = os.getenv(key, str(default)).lower()
-        return value in ('true', '1', 'yes', 'on')
-    
-    def _get_int_env(self, key: str, default: int) -> int:
-        """
-        获取整数类型环境变量
-        
-        :param key: 环境变量键
-        :param default: 默认值
-        :return: 整数值
-        """
-        try:
-            return int(os.getenv(key, str(default)))
-        except ValueError:
-            return default
-    
-    def _load_crawler_configs(self) -> Dict[str, Dict[str, Any]]:
+        self.CRAWLER_CONFIGS = self._load_crawler_configs(env)
+
+    def _load_crawler_configs(self, env) -> Dict[str, Dict[str, Any]]:
         """
         加载抓取器配置
-        
+
+        :param env: 环境变量映射
         :return: 抓取器配置字典
         """
         return {
             'hackernews': {
-                'max_pages': self._get_int_env('HN_MAX_PAGES', 1),
-                'delay': self._get_int_env('HN_DELAY', 1),
-                'fetch_content': self._get_bool_env('HN_FETCH_CONTENT', False),
-                'timeout': self._get_int_env('HN_TIMEOUT', 30)
+                'max_pages': _to_int(env.get('HN_MAX_PAGES'), 1),
+                'delay': _to_int(env.get('HN_DELAY'), 1),
+                'fetch_content': _to_bool(env.get('HN_FETCH_CONTENT'), False),
+                'timeout': _to_int(env.get('HN_TIMEOUT'), 30)
+            },
+            'hackernews-api': {
+                'max_items': _to_int(env.get('HN_API_MAX_ITEMS'), 30),
+                'timeout': _to_int(env.get('HN_API_TIMEOUT'), 30)
             }
         }
     
@@ -124,5 +158,17 @@ class Settings:
         }
 
 
+@lru_cache(maxsize=1)
+def get_settings(config_file: Optional[str] = None) -> Settings:
+    """
+    获取缓存的配置实例
+    首次调用构造 Settings，之后直接返回缓存对象
+
+    :param config_file: 配置文件路径
+    :return: 配置实例
+    """
+    return Settings(config_file)
+
+
 # 全局配置实例
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
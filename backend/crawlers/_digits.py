@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+数字提取快速路径
+从文本中提取首个整数（评分、评论数等字段）
+
+numba 可用时用 @njit 编译的ASCII字节扫描：逐字节累加
+val = val*10 + (b-48)，跳过正则引擎和中间对象构造；
+未安装时回退到预编译正则，行为完全一致
+"""
+
+import re
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+    _NUMBA_AVAILABLE = False
+
+_DIGITS_RE = re.compile(r'(\d+)')
+
+
+if _NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _scan_first_int(data):  # pragma: no cover - 编译路径依赖numba
+        """
+        扫描字节串中的首个连续数字段
+
+        :param data: UTF-8字节串
+        :return: 解析出的整数，无数字时返回-1
+        """
+        value = -1
+        for b in data:
+            if 48 <= b <= 57:
+                if value < 0:
+                    value = 0
+                value = value * 10 + (b - 48)
+            elif value >= 0:
+                break
+        return value
+
+    def parse_first_int(text: str, default: int = 0) -> int:
+        """
+        提取文本中的首个整数
+
+        :param text: 输入文本
+        :param default: 无数字时的默认值
+        :return: 整数值
+        """
+        value = _scan_first_int(text.encode('utf-8'))
+        return value if value >= 0 else default
+
+else:
+
+    def parse_first_int(text: str, default: int = 0) -> int:
+        """
+        提取文本中的首个整数
+
+        :param text: 输入文本
+        :param default: 无数字时的默认值
+        :return: 整数值
+        """
+        match = _DIGITS_RE.search(text)
+        return int(match.group(1)) if match else default
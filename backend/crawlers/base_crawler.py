@@ -5,15 +5,74 @@
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
+import atexit
 import logging
 import time
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import requests_cache
+    _REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    requests_cache = None
+    _REQUESTS_CACHE_AVAILABLE = False
+
 from backend.models.article import ArticleModel, CrawlResult
 
+_DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+# 默认请求头（User-Agent 由会话工厂参数决定）
+_DEFAULT_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+@lru_cache(maxsize=None)
+def _make_session(retries: int, backoff: float, user_agent: str,
+                  pool_maxsize: int = 32) -> requests.Session:
+    """
+    创建共享HTTP会话（按配置参数缓存）
+    相同配置的抓取器复用同一个会话：连接池和TLS上下文进程内只建一份
+
+    :param retries: 重试次数
+    :param backoff: 重试退避因子
+    :param user_agent: User-Agent请求头
+    :param pool_maxsize: 每个主机的连接池大小
+    :return: 配置好的requests会话
+    """
+    session = requests.Session()
+
+    # 配置重试策略
+    retry_strategy = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # 设置请求头
+    session.headers.update(_DEFAULT_HEADERS)
+    session.headers['User-Agent'] = user_agent
+
+    # 会话为进程级共享资源，进程退出时统一关闭
+    atexit.register(session.close)
+
+    return session
+
 
 class BaseCrawler(ABC):
     """
@@ -39,46 +98,54 @@ class BaseCrawler(ABC):
         
     def _create_session(self) -> requests.Session:
         """
-        创建HTTP会话，配置重试策略和超时
-        
+        获取HTTP会话
+        默认复用模块级共享会话（相同配置只建一份连接池）；
+        配置了 cache_path 且 requests-cache 可用时，创建实例专属的
+        SQLite缓存会话，重复URL直接从磁盘读取
+
         :return: 配置好的requests会话
         """
-        session = requests.Session()
-        
-        # 配置重试策略
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # 设置请求头
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
-        
-        return session
+        cache_path = self.config.get('cache_path')
+        if cache_path and _REQUESTS_CACHE_AVAILABLE:
+            session = requests_cache.CachedSession(
+                cache_path,
+                backend='sqlite',
+                expire_after=self.config.get('cache_ttl', 3600),
+                allowable_codes=(200,),
+                cache_control=True  # 优先遵循响应的 Cache-Control 头
+            )
+
+            # 缓存会话是实例专属的，配置与共享会话保持一致
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504],
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=32)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update(_DEFAULT_HEADERS)
+            session.headers['User-Agent'] = _DEFAULT_USER_AGENT
+
+            self._owns_session = True
+            return session
+
+        self._owns_session = False
+        return _make_session(3, 1, _DEFAULT_USER_AGENT)
     
-    def _make_request(self, url: str, timeout: int = 30) -> Optional[requests.Response]:
+    def _make_request(self, url: str, timeout: int = 30,
+                      stream: bool = False) -> Optional[requests.Response]:
         """
         发起HTTP请求，包含错误处理
-        
+
         :param url: 请求URL
         :param timeout: 超时时间
+        :param stream: 是否流式读取响应体（调用方负责消费）
         :return: 响应对象或None
         """
         try:
             self.logger.info(f"正在请求: {url}")
-            response = self.session.get(url, timeout=timeout)
+            response = self.session.get(url, timeout=timeout, stream=stream)
             response.raise_for_status()
             return response
         except requests.exceptions.RequestException as e:
@@ -136,8 +203,9 @@ class BaseCrawler(ABC):
     def cleanup(self) -> None:
         """
         清理资源
+        共享会话由 atexit 统一关闭，只关闭实例专属会话
         """
-        if hasattr(self, 'session'):
+        if getattr(self, '_owns_session', False) and hasattr(self, 'session'):
             self.session.close()
             
     def __enter__(self):
@@ -5,20 +5,75 @@
 """
 
 from typing import Dict, Type, Optional, Any
+from importlib import import_module
+from importlib.metadata import entry_points
 import logging
 
 from backend.crawlers.base_crawler import BaseCrawler
 
+# 内置抓取器的延迟注册表: 名称 -> "模块路径:类名"
+# 类在首次使用时才导入，只查配置/帮助的命令不用付出 bs4/lxml 的导入开销
+_BUILTIN_CRAWLERS = {
+    'hackernews': 'backend.crawlers.hackernews_crawler:HackerNewsCrawler',
+    'hackernews-api': 'backend.crawlers.hackernews_api_crawler:HackerNewsAPICrawler',
+}
+
+# 第三方抓取器通过该入口点分组注册
+_ENTRY_POINT_GROUP = 'hackernews.crawlers'
+
 
 class CrawlerFactory:
     """
     抓取器工厂类
     使用工厂模式创建和管理抓取器实例
     """
-    
+
     _crawlers: Dict[str, Type[BaseCrawler]] = {}
+    _lazy_crawlers: Dict[str, str] = dict(_BUILTIN_CRAWLERS)
+    _entry_points_scanned = False
     _logger = logging.getLogger("crawler.factory")
-    
+
+    @classmethod
+    def _scan_entry_points(cls) -> None:
+        """
+        扫描已安装包的入口点，补充到延迟注册表
+        只扫描一次，且不触发任何类导入
+        """
+        if cls._entry_points_scanned:
+            return
+        cls._entry_points_scanned = True
+        try:
+            for ep in entry_points(group=_ENTRY_POINT_GROUP):
+                cls._lazy_crawlers.setdefault(ep.name, ep.value)
+        except Exception as e:
+            cls._logger.warning(f"扫描抓取器入口点失败: {str(e)}")
+
+    @classmethod
+    def _resolve_crawler(cls, name: str) -> Optional[Type[BaseCrawler]]:
+        """
+        解析抓取器类，首次访问时才真正导入模块
+
+        :param name: 抓取器名称
+        :return: 抓取器类或None
+        """
+        if name in cls._crawlers:
+            return cls._crawlers[name]
+
+        cls._scan_entry_points()
+        target = cls._lazy_crawlers.get(name)
+        if target is None:
+            return None
+
+        try:
+            module_path, _, class_name = target.partition(':')
+            crawler_class = getattr(import_module(module_path), class_name)
+        except (ImportError, AttributeError) as e:
+            cls._logger.error(f"加载抓取器类失败 {name} ({target}): {str(e)}")
+            return None
+
+        cls.register_crawler(name, crawler_class)
+        return crawler_class
+
     @classmethod
     def register_crawler(cls, name: str, crawler_class: Type[BaseCrawler]) -> None:
         """
@@ -42,12 +97,12 @@ class CrawlerFactory:
         :param config: 配置参数
         :return: 抓取器实例或None
         """
-        if name not in cls._crawlers:
+        crawler_class = cls._resolve_crawler(name)
+        if crawler_class is None:
             cls._logger.error(f"未找到抓取器: {name}")
             return None
-            
+
         try:
-            crawler_class = cls._crawlers[name]
             crawler = crawler_class(config=config)
             cls._logger.info(f"创建抓取器实例: {name}")
             return crawler
@@ -62,17 +117,24 @@ class CrawlerFactory:
         
         :return: 抓取器名称和描述的字典
         """
+        cls._scan_entry_points()
         result = {}
-        for name, crawler_class in cls._crawlers.items():
-            result[name] = crawler_class.__doc__ or f"{name} 抓取器"
+        # 描述来自类docstring，列表命令本身低频，此处按需加载
+        for name in sorted(set(cls._crawlers) | set(cls._lazy_crawlers)):
+            crawler_class = cls._resolve_crawler(name)
+            if crawler_class is not None:
+                result[name] = crawler_class.__doc__ or f"{name} 抓取器"
         return result
-    
+
     @classmethod
     def is_crawler_available(cls, name: str) -> bool:
         """
-        检查抓取器是否可用
-        
+        检查抓取器是否可用（不触发类导入）
+
         :param name: 抓取器名称
         :return: 是否可用
         """
-        return name in cls._crawlers
\ No newline at end of file
+        if name in cls._crawlers:
+            return True
+        cls._scan_entry_points()
+        return name in cls._lazy_crawlers
\ No newline at end of file
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Hacker News API 抓取器
+通过官方 Firebase API 获取资讯内容，无需解析 HTML
+"""
+
+from typing import List, Dict, Any, Optional
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import requests
+
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    _HTTPX_AVAILABLE = False
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+from backend.crawlers.base_crawler import BaseCrawler
+from backend.models.article import ArticleModel, CrawlResult
+
+# 条目页面链接模板（纯文本帖子没有外部URL时使用）
+_ITEM_URL = "https://news.ycombinator.com/item?id={}"
+
+
+class HackerNewsAPICrawler(BaseCrawler):
+    """
+    Hacker News API 抓取器
+    通过 https://hacker-news.firebaseio.com 的官方API获取热门文章，
+    JSON 条目只有几百字节，完全避免 HTML 解析的 CPU 开销
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        初始化 Hacker News API 抓取器
+
+        :param config: 配置参数字典
+                      {
+                          "max_items": 30,     # 最大抓取条目数
+                          "timeout": 30,       # 请求超时时间
+                          "concurrency": 8     # 条目请求并发数
+                      }
+        """
+        default_config = {
+            "max_items": 30,
+            "timeout": 30,
+            "concurrency": 8
+        }
+
+        if config:
+            default_config.update(config)
+
+        super().__init__(
+            name="hackernews-api",
+            base_url="https://hacker-news.firebaseio.com/v0",
+            config=default_config
+        )
+
+    def crawl(self) -> CrawlResult:
+        """
+        执行 Hacker News API 抓取任务
+
+        :return: 抓取结果
+        """
+        try:
+            self.logger.info("开始通过API抓取 Hacker News")
+
+            # 获取热门文章ID列表
+            response = self._make_request(
+                f"{self.base_url}/topstories.json",
+                timeout=int(self.config.get('timeout', 30))
+            )
+
+            if not response:
+                return CrawlResult(
+                    source_name=self.name,
+                    success=False,
+                    error_message="无法访问 Hacker News API"
+                )
+
+            max_items = max(1, int(self.config.get('max_items', 30)))
+            story_ids = _loads(response.content)[:max_items]
+
+            # 并发获取条目详情
+            articles = self._fetch_items(story_ids)
+
+            self.logger.info(f"成功抓取 {len(articles)} 篇文章")
+
+            return CrawlResult(
+                articles=articles,
+                total_count=len(articles),
+                source_name=self.name,
+                success=True
+            )
+
+        except Exception as e:
+            self.logger.error(f"抓取过程中发生错误: {str(e)}")
+            return CrawlResult(
+                source_name=self.name,
+                success=False,
+                error_message=str(e)
+            )
+
+    def parse_page(self, response: requests.Response) -> List[ArticleModel]:
+        """
+        解析单个条目的API响应
+
+        :param response: HTTP响应对象
+        :return: 解析出的文章列表（0或1个元素）
+        """
+        article = self._parse_item(response.content)
+        return [article] if article else []
+
+    def _fetch_items(self, story_ids: List[int]) -> List[ArticleModel]:
+        """
+        并发获取所有条目详情并解析为文章模型
+
+        :param story_ids: 条目ID列表
+        :return: 文章列表（保持输入顺序，失败条目被跳过）
+        """
+        urls = [f"{self.base_url}/item/{item_id}.json" for item_id in story_ids]
+
+        if _HTTPX_AVAILABLE:
+            payloads = asyncio.run(self._afetch_items(urls))
+        else:
+            max_workers = max(1, int(self.config.get('concurrency', 8)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                payloads = list(executor.map(self._fetch_item, urls))
+
+        articles = []
+        for payload in payloads:
+            if not payload:
+                continue
+            article = self._parse_item(payload)
+            if article:
+                articles.append(article)
+
+        return articles
+
+    async def _afetch_items(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        通过 httpx.AsyncClient 并发获取条目JSON
+
+        :param urls: 条目URL列表
+        :return: 与输入顺序对应的响应字节列表
+        """
+        limits = httpx.Limits(max_connections=int(self.config.get('concurrency', 8)) * 2)
+        timeout = int(self.config.get('timeout', 30))
+
+        async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+            tasks = [self._afetch_item(client, url) for url in urls]
+            return await asyncio.gather(*tasks)
+
+    async def _afetch_item(self, client, url: str) -> Optional[bytes]:
+        """
+        异步获取单个条目的JSON字节
+
+        :param client: httpx.AsyncClient 实例
+        :param url: 条目URL
+        :return: 响应字节或None
+        """
+        try:
+            response = await client.get(url)
+            if response.status_code != 200:
+                self.logger.warning(f"HTTP {response.status_code} for {url}")
+                return None
+            return response.content
+        except httpx.HTTPError as e:
+            self.logger.warning(f"请求失败 {url}: {str(e)}")
+            return None
+
+    def _fetch_item(self, url: str) -> Optional[bytes]:
+        """
+        同步获取单个条目的JSON字节（线程池回退路径）
+
+        :param url: 条目URL
+        :return: 响应字节或None
+        """
+        try:
+            response = self.session.get(url, timeout=int(self.config.get('timeout', 30)))
+            if response.status_code != 200:
+                self.logger.warning(f"HTTP {response.status_code} for {url}")
+                return None
+            return response.content
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"请求失败 {url}: {str(e)}")
+            return None
+
+    def _parse_item(self, payload: bytes) -> Optional[ArticleModel]:
+        """
+        将条目JSON解析为文章模型
+
+        :param payload: 条目JSON字节
+        :return: 文章模型或None
+        """
+        try:
+            item = _loads(payload)
+            if not item or item.get('type') != 'story' or 'title' not in item:
+                return None
+
+            # 纯文本帖子（Ask HN 等）没有外部URL，回退到条目页面
+            url = item.get('url') or _ITEM_URL.format(item['id'])
+
+            return ArticleModel(
+                title=item['title'],
+                url=url,
+                source_name=self.name,
+                score=item.get('score', 0),
+                comments_count=item.get('descendants', 0),
+                created_at=datetime.now()
+            )
+
+        except Exception as e:
+            self.logger.warning(f"解析条目失败: {str(e)}")
+            return None
@@ -4,14 +4,353 @@ Hacker News 抓取器
 专门用于抓取 Hacker News 网站的资讯内容
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import hashlib
+import logging
+import os
 import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 import requests
 
+try:
+    import httpx
+    _HTTPX_AVAILABLE = True
+except ImportError:
+    httpx = None
+    _HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  httpx 的 HTTP/2 支持依赖 h2
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 from backend.crawlers.base_crawler import BaseCrawler
+from backend.crawlers._digits import parse_first_int
 from backend.models.article import ArticleModel, CrawlResult
+from backend.models.article_dc import Article
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    _LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    lxml_html = None
+    _LXML_AVAILABLE = False
+
+# lxml 可用时 BeautifulSoup 走 C 级解析器，否则回退纯 Python 解析器
+_BS_PARSER = 'lxml' if _LXML_AVAILABLE else 'html.parser'
+
+# 模块级预编译正则，避免热路径上重复查 re 缓存
+_WS_RE = re.compile(r'\s+')
+_ANTIBOT_BYTES_RE = re.compile(
+    '(?:just a moment|verify|cloudflare|checking your browser|验证)'.encode('utf-8'), re.I
+)
+
+# 反爬虫页面只需检查响应头部的字节，无需遍历整个文档
+_ANTIBOT_SNIFF_SIZE = 16384
+
+_ANTIBOT_MESSAGE = "内容无法获取：网站启用了反爬虫保护"
+
+# 通用内容提取的选择器及基础分值（按优先级排列，静态不变）
+_CONTENT_SELECTORS = (
+    ('article', 500),  # 文章标签，最高优先级
+    ('main', 300),     # 主内容区域
+    ('.post-content', 400),
+    ('.entry-content', 400),
+    ('.content', 200),
+    ('.markdown-body', 400),
+    ('.prose', 300),
+    ('div[role="main"]', 300),
+)
+
+# 候选内容达到该分值后不再尝试后续选择器
+_EARLY_EXIT_SCORE = 600
+
+# 页面结构是静态的，XPath 在模块导入时预编译一次即可
+if _LXML_AVAILABLE:
+    _ATHING_XPATH = etree.XPath(
+        "//tr[contains(concat(' ', normalize-space(@class), ' '), ' athing ')]"
+    )
+    _TITLELINE_LINK_XPATH = etree.XPath(".//span[@class='titleline']/a")
+    _SUBTEXT_XPATH = etree.XPath(".//td[@class='subtext']")
+    _SCORE_XPATH = etree.XPath(".//span[@class='score']")
+    _LINKS_XPATH = etree.XPath(".//a")
+
+# 快速路径：直接在原始字节上扫描文章行，完全绕过 DOM 构建
+# 任何一行结构不符合预期时整页回退到 DOM 解析
+_ROW_START_RE = re.compile(
+    rb"<tr[^>]*class=['\"][^'\"]*\bathing\b[^'\"]*['\"][^>]*id=['\"](\d+)['\"]"
+)
+_TITLE_LINK_RE = re.compile(
+    rb'<span class="titleline"><a href="([^"]+)"[^>]*>([^<]+)</a>'
+)
+_SCORE_BYTES_RE = re.compile(rb'class="score"[^>]*>(\d+)')
+_COMMENTS_BYTES_RE = re.compile(rb'item\?id=\d+[^>]*>(\d+)(?:&nbsp;|\s)comments?<')
+
+
+def _parse_rows_fast(content: bytes, base_url: str,
+                     source_name: str) -> Optional[List[Article]]:
+    """
+    字节级快速解析文章行
+    在原始字节上做一遍正则扫描提取全部字段，只对保留的字段解码，
+    不构建任何 DOM；结构与预期不符时返回 None，由调用方回退
+
+    :param content: 页面原始字节内容
+    :param base_url: 站点基础URL
+    :param source_name: 抓取源名称
+    :return: 文章列表，快速路径未命中时为None
+    """
+    row_starts = list(_ROW_START_RE.finditer(content))
+    if not row_starts:
+        return None
+
+    articles = []
+    for index, match in enumerate(row_starts):
+        end = row_starts[index + 1].start() if index + 1 < len(row_starts) else len(content)
+        segment = content[match.start():end]
+
+        title_match = _TITLE_LINK_RE.search(segment)
+        if not title_match:
+            # 行结构不符合预期，整页回退到 DOM 解析
+            return None
+
+        url = unescape(title_match.group(1).decode('utf-8', 'replace'))
+        title = unescape(title_match.group(2).decode('utf-8', 'replace')).strip()
+
+        # 处理相对链接
+        if url.startswith('item?id='):
+            url = f"{base_url}/{url}"
+        elif url.startswith('/'):
+            url = f"{base_url}{url}"
+
+        score_match = _SCORE_BYTES_RE.search(segment)
+        score = int(score_match.group(1)) if score_match else 0
+
+        comments_match = _COMMENTS_BYTES_RE.search(segment)
+        comments_count = int(comments_match.group(1)) if comments_match else 0
+
+        articles.append(Article(
+            title=title,
+            url=url,
+            source_name=source_name,
+            score=score,
+            comments_count=comments_count,
+            created_at=datetime.now()
+        ))
+
+    return articles
+
+
+def _parse_content(url: str,
+                   raw_content: bytes) -> Tuple[Optional[str], List[Tuple[int, str]]]:
+    """
+    从页面字节内容中提取文章正文
+    模块级函数，可提交到 ProcessPoolExecutor 在工作进程中执行。
+    工作进程里没有日志监听线程，直接写日志会被静默丢弃，
+    因此日志以 (级别, 消息) 列表返回，由父进程统一记录
+
+    :param url: 文章URL
+    :param raw_content: 页面原始字节内容
+    :return: (文章内容或None, 待父进程记录的日志列表)
+    """
+    notes: List[Tuple[int, str]] = []
+
+    # 检查是否遇到验证页面或反爬虫机制：只扫描头部原始字节，
+    # 既跳过整个 DOM 遍历，也避免了无谓的解析
+    if _ANTIBOT_BYTES_RE.search(raw_content[:_ANTIBOT_SNIFF_SIZE]):
+        notes.append((logging.WARNING, f"检测到反爬虫机制: {url}"))
+        return _ANTIBOT_MESSAGE, notes
+
+    soup = BeautifulSoup(raw_content, _BS_PARSER)
+
+    # 使用网站特定的内容提取策略
+    content = _extract_content_by_site(url, soup, notes)
+    if content:
+        return content, notes
+
+    # 通用内容提取策略
+    content = _extract_content_generic(soup, notes)
+    if content:
+        return content, notes
+
+    notes.append((logging.DEBUG, f"无法提取内容: {url}"))
+    return None, notes
+
+
+def _extract_content_by_site(url: str, soup: BeautifulSoup,
+                             notes: List[Tuple[int, str]]) -> Optional[str]:
+    """
+    根据网站特定结构提取内容
+
+    :param url: 文章URL
+    :param soup: BeautifulSoup对象
+    :param notes: 收集待父进程记录的日志 (级别, 消息)
+    :return: 提取的内容或None
+    """
+    try:
+        # Anthropic网站
+        if 'anthropic.com' in url:
+            # 优先尝试article标签
+            article_elem = soup.find('article')
+            if article_elem:
+                # 移除导航和其他非内容元素
+                for elem in article_elem.find_all(['nav', 'header', 'footer', 'aside']):
+                    elem.decompose()
+                
+                content = article_elem.get_text(separator=' ', strip=True)
+                if len(content) > 200:
+                    # 清理内容，移除多余空白
+                    content = _WS_RE.sub(' ', content).strip()
+                    # 限制内容长度，但保持完整性
+                    if len(content) > 3000:
+                        content = content[:3000] + "..."
+                    return content
+        
+        # GitHub网站
+        elif 'github.com' in url:
+            readme_elem = soup.find('article', class_='markdown-body')
+            if readme_elem:
+                content = readme_elem.get_text(separator=' ', strip=True)
+                if len(content) > 200:
+                    content = _WS_RE.sub(' ', content).strip()
+                    if len(content) > 2000:
+                        content = content[:2000] + "..."
+                    return content
+        
+        # NPM网站 - 处理反爬虫情况
+        elif 'npmjs.com' in url:
+            # 如果遇到验证页面，返回特殊提示
+            if soup.title and 'just a moment' in soup.title.get_text().lower():
+                return "NPM包页面：由于反爬虫保护，无法直接获取内容。请访问链接查看详情。"
+            
+            # 尝试提取包描述
+            desc_elem = soup.find('p', {'data-testid': 'description'}) or soup.find('.package-description')
+            if desc_elem:
+                return desc_elem.get_text(strip=True)
+        
+        return None
+        
+    except Exception as e:
+        notes.append((logging.DEBUG, f"网站特定内容提取失败 {url}: {str(e)}"))
+        return None
+
+
+def _extract_content_generic(soup: BeautifulSoup,
+                             notes: List[Tuple[int, str]]) -> Optional[str]:
+    """
+    通用内容提取策略
+
+    :param soup: BeautifulSoup对象
+    :param notes: 收集待父进程记录的日志 (级别, 消息)
+    :return: 提取的内容或None
+    """
+    try:
+        # 一次性移除整个文档中的脚本、样式等非内容元素
+        # 避免每个候选元素重复遍历并修改子树
+        for tag in soup.find_all(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+            tag.decompose()
+
+        best_content = None
+        best_score = 0
+
+        # 按优先级尝试不同的选择器
+        for selector, base_score in _CONTENT_SELECTORS:
+            elements = soup.select(selector)
+            for elem in elements:
+                content = elem.get_text(separator=' ', strip=True)
+                if len(content) < 100:  # 内容太短，跳过
+                    continue
+
+                # 计算内容质量分数
+                score = base_score + min(len(content) // 10, 200)  # 长度加分，但有上限
+
+                if score > best_score:
+                    best_content = content
+                    best_score = score
+
+            # 选择器按优先级排列，候选足够好时提前结束
+            if best_score >= _EARLY_EXIT_SCORE:
+                break
+        
+        if best_content:
+            # 清理和格式化内容
+            best_content = _WS_RE.sub(' ', best_content).strip()
+            
+            # 智能截断：尝试在句子结束处截断
+            if len(best_content) > 2500:
+                truncate_pos = 2500
+                # 寻找最近的句号、问号或感叹号
+                for i in range(truncate_pos, max(truncate_pos - 200, 0), -1):
+                    if best_content[i] in '.!?':
+                        truncate_pos = i + 1
+                        break
+                best_content = best_content[:truncate_pos]
+                if not best_content.endswith('...'):
+                    best_content += "..."
+            
+            return best_content
+        
+        # 最后尝试：收集所有段落
+        paragraphs = soup.find_all('p')
+        if paragraphs:
+            content_parts = []
+            total_length = 0
+            
+            for p in paragraphs:
+                text = p.get_text(strip=True)
+                if len(text) > 20 and total_length < 2000:  # 过滤太短的段落
+                    content_parts.append(text)
+                    total_length += len(text)
+            
+            if content_parts:
+                content = ' '.join(content_parts)
+                if len(content) > 100:
+                    return content
+        
+        return None
+        
+    except Exception as e:
+        notes.append((logging.DEBUG, f"通用内容提取失败: {str(e)}"))
+        return None
+
+
+class _TokenBucket:
+    """
+    简单的令牌桶限速器
+    并发抓取时按固定间隔放行请求，替代串行的 time.sleep
+    """
+
+    def __init__(self, interval: float):
+        """
+        :param interval: 相邻请求之间的最小间隔（秒）
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self) -> None:
+        """
+        获取一个请求令牌，必要时阻塞等待
+        """
+        if self.interval <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if wait > 0:
+            time.sleep(wait)
 
 
 class HackerNewsCrawler(BaseCrawler):
@@ -29,7 +368,8 @@ class HackerNewsCrawler(BaseCrawler):
                           "max_pages": 1,      # 最大抓取页数
                           "delay": 1,          # 请求延迟（秒）
                           "fetch_content": False,  # 是否抓取文章内容
-                          "timeout": 30        # 请求超时时间
+                          "timeout": 30,       # 请求超时时间
+                          "concurrency": 8     # 内容抓取并发数
                       }
         """
         # 设置默认配置，启用内容抓取
@@ -37,18 +377,29 @@ class HackerNewsCrawler(BaseCrawler):
             "max_pages": 1,
             "delay": 1,
             "fetch_content": True,  # 默认启用内容抓取
-            "timeout": 30
+            "timeout": 30,
+            "concurrency": 8
         }
-        
+
         # 合并用户配置和默认配置
         if config:
             default_config.update(config)
-        
+
         super().__init__(
             name="hackernews",
             base_url="https://news.ycombinator.com",
             config=default_config
         )
+
+        # 并发抓取内容时的限速器
+        self._rate_limiter = _TokenBucket(float(self.config.get('delay', 1)))
+
+        # 最近一次的 (页面哈希, 解析结果)，页面未变化时跳过整个解析流程。
+        # 首页字节几乎每次抓取都不同，只留最新一条，历史条目不会无界累积
+        self._parse_cache: Optional[Tuple[str, List[ArticleModel]]] = None
+
+        # CPU 密集的内容解析使用的进程池（懒创建，跨多次抓取复用）
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
     
     def crawl(self) -> CrawlResult:
         """
@@ -98,35 +449,202 @@ class HackerNewsCrawler(BaseCrawler):
         :return: 解析出的文章列表
         """
         articles = []
-        
+        cache_key = None
+
         try:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 查找所有文章条目
-            # Hacker News 使用 .athing 类标识文章行
-            article_rows = soup.find_all('tr', class_='athing')
-            
-            for row in article_rows:
-                try:
-                    article = self._parse_article_row(row, soup)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    self.logger.warning(f"解析文章行时出错: {str(e)}")
-                    continue
-                    
+            # 完整响应字节（快速路径的正则扫描需要整页内容）
+            content = response.content
+
+            # 页面字节内容未变化时直接复用上次的解析结果
+            cache_key = hashlib.sha1(content).hexdigest()
+            cached = self._parse_cache
+            if cached is not None and cached[0] == cache_key:
+                self.logger.debug("页面内容未变化，使用缓存的解析结果")
+                return cached[1]
+
+            # 快速路径：字节级正则扫描，完全绕过 DOM 构建
+            fast_articles = _parse_rows_fast(content, self.base_url, self.name)
+            if fast_articles is not None:
+                articles = fast_articles
+            else:
+                # 回退路径：构建 DOM 后按元素解析
+                self.logger.debug("快速路径未命中，回退到 DOM 解析")
+                tree = lxml_html.fromstring(content)
+
+                # 查找所有文章条目
+                # Hacker News 使用 .athing 类标识文章行
+                article_rows = _ATHING_XPATH(tree)
+
+                # 热循环前绑定为局部变量，省去每次迭代的属性查找
+                _append = articles.append
+                _parse = self._parse_article_row
+                _warn = self.logger.warning
+
+                for row in article_rows:
+                    try:
+                        # 元数据行紧跟在文章行之后，getnext() 是 O(1) 的C指针访问
+                        article = _parse(row, row.getnext())
+                        if article is not None:
+                            _append(article)
+                    except Exception as e:
+                        # %s 延迟格式化：日志级别关闭时不构建字符串
+                        _warn("解析文章行时出错: %s", e)
+                        continue
+
         except Exception as e:
             self.logger.error(f"解析页面时出错: {str(e)}")
-            
+
+        # 获取文章内容（如果配置要求），并发执行
+        if articles and self.config.get('fetch_content', False):
+            self._fetch_contents(articles)
+
+        # 边界处再转换为带验证的 Pydantic 模型；单篇校验失败只跳过该文章
+        validated = []
+        for article in articles:
+            try:
+                validated.append(article.to_pydantic())
+            except Exception as e:
+                self.logger.warning("文章校验失败，已跳过 %s: %s", article.url, e)
+        articles = validated
+
+        if cache_key:
+            self._parse_cache = (cache_key, articles)
         return articles
-    
-    def _parse_article_row(self, row, soup: BeautifulSoup) -> Optional[ArticleModel]:
+
+    def _fetch_contents(self, articles: List[Article]) -> None:
+        """
+        并发抓取所有文章的内容并填充到模型上
+
+        :param articles: 待填充内容的文章列表
+        """
+        urls = [article.url for article in articles]
+
+        if _HTTPX_AVAILABLE and not getattr(self, '_owns_session', False):
+            # 单线程事件循环处理全部在途请求，HTTP/2 可复用连接
+            payloads = asyncio.run(self._afetch_contents(urls))
+        else:
+            # 配置了 cache_path 时走实例专属的缓存会话（httpx 客户端
+            # 不经过 requests-cache，走它会让磁盘缓存形同虚设）；
+            # httpx 不可用时同样回退到线程池
+            max_workers = max(1, int(self.config.get('concurrency', 8)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                payloads = list(executor.map(self._fetch_article_raw, urls))
+
+        contents = self._parse_contents(urls, payloads)
+
+        for article, content in zip(articles, contents):
+            if content:
+                article.content = content
+
+    def _parse_contents(self, urls: List[str],
+                        payloads: List[Optional[bytes]]) -> List[Optional[str]]:
+        """
+        在进程池中解析抓取到的页面字节，真正并行利用多核
+
+        :param urls: 文章URL列表
+        :param payloads: 与URL对应的页面字节列表
+        :return: 与输入顺序对应的内容列表
+        """
+        contents: List[Optional[str]] = [None] * len(urls)
+
+        pool = self._get_parse_pool()
+        futures = {}
+        for index, (url, payload) in enumerate(zip(urls, payloads)):
+            if payload:
+                futures[index] = pool.submit(_parse_content, url, payload)
+
+        for index, future in futures.items():
+            try:
+                content, notes = future.result()
+                contents[index] = content
+                # 工作进程攒下的日志在父进程统一记录
+                for level, message in notes:
+                    self.logger.log(level, message)
+            except Exception as e:
+                self.logger.warning(f"解析文章内容失败 {urls[index]}: {str(e)}")
+
+        return contents
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        获取内容解析进程池（懒创建）
+
+        :return: 进程池实例
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
+
+    def cleanup(self) -> None:
+        """
+        清理资源，关闭进程池
+        """
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
+            self._parse_pool = None
+        super().cleanup()
+
+    async def _afetch_contents(self, urls: List[str]) -> List[Optional[bytes]]:
+        """
+        通过 httpx.AsyncClient 并发抓取所有文章页面
+
+        :param urls: 文章URL列表
+        :return: 与输入顺序对应的页面字节列表
+        """
+        limits = httpx.Limits(max_connections=32)
+        # 按域名限制并发，保持对单个站点的礼貌性
+        semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        async with httpx.AsyncClient(
+            headers=dict(self.session.headers),
+            timeout=10,
+            limits=limits,
+            follow_redirects=True,
+            http2=_HTTP2_AVAILABLE
+        ) as client:
+            tasks = [
+                self._afetch_article_raw(client, semaphores, url)
+                for url in urls
+            ]
+            return await asyncio.gather(*tasks)
+
+    async def _afetch_article_raw(self, client, semaphores: Dict[str, asyncio.Semaphore],
+                                  url: str) -> Optional[bytes]:
+        """
+        异步获取单篇文章的页面字节
+
+        :param client: httpx.AsyncClient 实例
+        :param semaphores: 按域名的并发信号量
+        :param url: 文章URL
+        :return: 页面字节或None
+        """
+        host = urlparse(url).netloc
+        semaphore = semaphores.setdefault(host, asyncio.Semaphore(2))
+
+        try:
+            async with semaphore:
+                response = await client.get(url)
+
+            if response.status_code != 200:
+                self.logger.warning(f"HTTP {response.status_code} for {url}")
+                return None
+
+            return response.content
+
+        except httpx.HTTPError as e:
+            self.logger.warning(f"请求失败 {url}: {str(e)}")
+            return None
+        except Exception as e:
+            self.logger.warning(f"获取文章内容失败 {url}: {str(e)}")
+            return None
+
+    def _parse_article_row(self, row, meta_row) -> Optional[Article]:
         """
         解析单个文章行
-        
-        :param row: 文章行元素
-        :param soup: BeautifulSoup对象
-        :return: 文章模型或None
+
+        :param row: 文章行元素（lxml元素）
+        :param meta_row: 紧随其后的元数据行元素（可能为None）
+        :return: 文章数据类或None
         """
         try:
             # 获取文章ID
@@ -134,60 +652,55 @@ class HackerNewsCrawler(BaseCrawler):
             if not article_id:
                 self.logger.debug("文章行缺少ID属性")
                 return None
-            
+
             # 查找标题链接
-            title_cell = row.find('span', class_='titleline')
-            if not title_cell:
-                self.logger.debug(f"文章 {article_id} 未找到titleline元素")
-                return None
-                
-            title_link = title_cell.find('a')
-            if not title_link:
+            title_links = _TITLELINE_LINK_XPATH(row)
+            if not title_links:
                 self.logger.debug(f"文章 {article_id} 未找到标题链接")
                 return None
-                
-            title = title_link.get_text(strip=True)
+
+            title_link = title_links[0]
+            title = title_link.text_content().strip()
             url = title_link.get('href', '')
-            
+
             # 处理相对链接
             if url.startswith('item?id='):
                 url = f"{self.base_url}/{url}"
             elif url.startswith('/'):
                 url = f"{self.base_url}{url}"
-            
-            # 查找对应的元数据行（下一行）
-            meta_row = row.find_next_sibling('tr')
+
             score = 0
             comments_count = 0
-            
-            if meta_row:
+
+            if meta_row is not None:
                 # 查找subtext元素
-                subtext = meta_row.find('td', class_='subtext')
-                if subtext:
+                subtexts = _SUBTEXT_XPATH(meta_row)
+                if subtexts:
+                    subtext = subtexts[0]
                     # 查找评分
-                    score_span = subtext.find('span', class_='score')
-                    if score_span:
-                        score_text = score_span.get_text(strip=True)
-                        score_match = re.search(r'(\d+)', score_text)
-                        if score_match:
-                            score = int(score_match.group(1))
+                    score_spans = _SCORE_XPATH(subtext)
+                    if score_spans:
+                        score_text = score_spans[0].text_content().strip()
+                        value = parse_first_int(score_text, -1)
+                        if value >= 0:
+                            score = value
                             self.logger.debug(f"文章 {article_id} 评分: {score}")
                     else:
                         self.logger.debug(f"文章 {article_id} 未找到评分信息")
-                    
+
                     # 查找评论数 - 查找所有链接，找到包含"comments"的链接
-                    links = subtext.find_all('a')
+                    links = _LINKS_XPATH(subtext)
                     for link in links:
                         href = link.get('href', '')
-                        text = link.get_text(strip=True)
+                        text = link.text_content().strip()
                         # 查找评论链接：包含item?id=且文本包含comment
                         if 'item?id=' in href and 'comment' in text.lower():
-                            comments_match = re.search(r'(\d+)', text)
-                            if comments_match:
-                                comments_count = int(comments_match.group(1))
+                            value = parse_first_int(text, -1)
+                            if value >= 0:
+                                comments_count = value
                                 self.logger.debug(f"文章 {article_id} 评论数: {comments_count}")
                                 break
-                    
+
                     if comments_count == 0:
                         self.logger.debug(f"文章 {article_id} 未找到评论数信息")
                 else:
@@ -195,15 +708,10 @@ class HackerNewsCrawler(BaseCrawler):
             else:
                 self.logger.debug(f"文章 {article_id} 未找到元数据行")
             
-            # 获取文章内容（如果配置要求）
-            content = None
-            if self.config.get('fetch_content', False):
-                content = self._fetch_article_content(url)
-            
-            # 创建文章模型
-            article = ArticleModel(
+            # 创建轻量文章数据类（内容由 parse_page 统一并发抓取，
+            # 返回前再转换为 Pydantic 模型）
+            article = Article(
                 title=title,
-                content=content,
                 url=url,
                 source_name=self.name,
                 score=score,
@@ -218,53 +726,25 @@ class HackerNewsCrawler(BaseCrawler):
             self.logger.warning(f"解析文章行失败 (ID: {article_id if 'article_id' in locals() else 'unknown'}): {str(e)}")
             return None
     
-    def _fetch_article_content(self, url: str) -> Optional[str]:
+    def _fetch_article_raw(self, url: str) -> Optional[bytes]:
         """
-        获取文章内容
-        
+        获取文章的页面字节（线程池回退路径）
+
         :param url: 文章URL
-        :return: 文章内容或None
+        :return: 页面字节或None
         """
         try:
-            # 添加延迟避免过于频繁的请求
-            self._delay_between_requests()
-            
-            # 添加更完整的请求头，避免被反爬虫机制拦截
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            # 限速避免过于频繁的请求（并发安全）
+            self._rate_limiter.acquire()
+
+            # 复用会话：连接池 + keep-alive，请求头已在会话上配置
+            response = self.session.get(url, timeout=10)
             if response.status_code != 200:
                 self.logger.warning(f"HTTP {response.status_code} for {url}")
                 return None
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 检查是否遇到验证页面或反爬虫机制
-            page_text = soup.get_text().lower()
-            if any(keyword in page_text for keyword in ['just a moment', '验证', 'verify', 'cloudflare', 'checking your browser']):
-                self.logger.warning(f"检测到反爬虫机制: {url}")
-                return "内容无法获取：网站启用了反爬虫保护"
-            
-            # 使用网站特定的内容提取策略
-            content = self._extract_content_by_site(url, soup)
-            if content:
-                return content
-            
-            # 通用内容提取策略
-            content = self._extract_content_generic(soup)
-            if content:
-                return content
-                
-            self.logger.debug(f"无法提取内容: {url}")
-            return None
-            
+
+            return response.content
+
         except requests.exceptions.Timeout:
             self.logger.warning(f"请求超时: {url}")
             return None
@@ -274,144 +754,7 @@ class HackerNewsCrawler(BaseCrawler):
         except Exception as e:
             self.logger.warning(f"获取文章内容失败 {url}: {str(e)}")
             return None
-    
-    def _extract_content_by_site(self, url: str, soup: BeautifulSoup) -> Optional[str]:
-        """
-        根据网站特定结构提取内容
-        
-        :param url: 文章URL
-        :param soup: BeautifulSoup对象
-        :return: 提取的内容或None
-        """
-        try:
-            # Anthropic网站
-            if 'anthropic.com' in url:
-                # 优先尝试article标签
-                article_elem = soup.find('article')
-                if article_elem:
-                    # 移除导航和其他非内容元素
-                    for elem in article_elem.find_all(['nav', 'header', 'footer', 'aside']):
-                        elem.decompose()
-                    
-                    content = article_elem.get_text(separator=' ', strip=True)
-                    if len(content) > 200:
-                        # 清理内容，移除多余空白
-                        content = ' '.join(content.split())
-                        # 限制内容长度，但保持完整性
-                        if len(content) > 3000:
-                            content = content[:3000] + "..."
-                        return content
-            
-            # GitHub网站
-            elif 'github.com' in url:
-                readme_elem = soup.find('article', class_='markdown-body')
-                if readme_elem:
-                    content = readme_elem.get_text(separator=' ', strip=True)
-                    if len(content) > 200:
-                        content = ' '.join(content.split())
-                        if len(content) > 2000:
-                            content = content[:2000] + "..."
-                        return content
-            
-            # NPM网站 - 处理反爬虫情况
-            elif 'npmjs.com' in url:
-                # 如果遇到验证页面，返回特殊提示
-                if soup.title and 'just a moment' in soup.title.get_text().lower():
-                    return "NPM包页面：由于反爬虫保护，无法直接获取内容。请访问链接查看详情。"
-                
-                # 尝试提取包描述
-                desc_elem = soup.find('p', {'data-testid': 'description'}) or soup.find('.package-description')
-                if desc_elem:
-                    return desc_elem.get_text(strip=True)
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"网站特定内容提取失败 {url}: {str(e)}")
-            return None
-    
-    def _extract_content_generic(self, soup: BeautifulSoup) -> Optional[str]:
-        """
-        通用内容提取策略
-        
-        :param soup: BeautifulSoup对象
-        :return: 提取的内容或None
-        """
-        try:
-            # 按优先级尝试不同的选择器
-            content_selectors = [
-                ('article', 500),  # 文章标签，最高优先级
-                ('main', 300),     # 主内容区域
-                ('.post-content', 400),
-                ('.entry-content', 400),
-                ('.content', 200),
-                ('.markdown-body', 400),
-                ('.prose', 300),
-                ('div[role="main"]', 300),
-            ]
-            
-            best_content = None
-            best_score = 0
-            
-            for selector, base_score in content_selectors:
-                elements = soup.select(selector)
-                for elem in elements:
-                    # 移除脚本、样式等非内容元素
-                    for tag in elem.find_all(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                        tag.decompose()
-                    
-                    content = elem.get_text(separator=' ', strip=True)
-                    if len(content) < 100:  # 内容太短，跳过
-                        continue
-                    
-                    # 计算内容质量分数
-                    score = base_score + min(len(content) // 10, 200)  # 长度加分，但有上限
-                    
-                    if score > best_score:
-                        best_content = content
-                        best_score = score
-            
-            if best_content:
-                # 清理和格式化内容
-                best_content = ' '.join(best_content.split())
-                
-                # 智能截断：尝试在句子结束处截断
-                if len(best_content) > 2500:
-                    truncate_pos = 2500
-                    # 寻找最近的句号、问号或感叹号
-                    for i in range(truncate_pos, max(truncate_pos - 200, 0), -1):
-                        if best_content[i] in '.!?':
-                            truncate_pos = i + 1
-                            break
-                    best_content = best_content[:truncate_pos]
-                    if not best_content.endswith('...'):
-                        best_content += "..."
-                
-                return best_content
-            
-            # 最后尝试：收集所有段落
-            paragraphs = soup.find_all('p')
-            if paragraphs:
-                content_parts = []
-                total_length = 0
-                
-                for p in paragraphs:
-                    text = p.get_text(strip=True)
-                    if len(text) > 20 and total_length < 2000:  # 过滤太短的段落
-                        content_parts.append(text)
-                        total_length += len(text)
-                
-                if content_parts:
-                    content = ' '.join(content_parts)
-                    if len(content) > 100:
-                        return content
-            
-            return None
-            
-        except Exception as e:
-            self.logger.debug(f"通用内容提取失败: {str(e)}")
-            return None
-    
+
     def validate_config(self) -> bool:
         """
         验证配置参数
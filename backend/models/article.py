@@ -6,7 +6,15 @@
 
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, HttpUrl, Field
+import json
+from pydantic import BaseModel, HttpUrl, Field, PrivateAttr
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
 
 
 class ArticleModel(BaseModel):
@@ -31,37 +39,62 @@ class ArticleModel(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="创建时间")
     tags: Optional[List[str]] = Field(default_factory=list, description="文章标签列表")
 
-    class Config:
-        """Pydantic配置"""
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            HttpUrl: lambda v: str(v)
-        }
-        
+    # 格式化结果缓存，同一实例重复输出时不再重新构建字符串/重复编码
+    _text_cache: Optional[str] = PrivateAttr(None)
+    _bytes_cache: Optional[bytes] = PrivateAttr(None)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        序列化为JSON字节
+        orjson 可用时走 Rust 实现（原生处理 datetime），否则回退标准库
+
+        :return: UTF-8编码的JSON字节
+        """
+        if _ORJSON_AVAILABLE:
+            # HttpUrl 等非原生类型通过 default=str 转换
+            return orjson.dumps(self.model_dump(), default=str)
+        return json.dumps(self.model_dump(mode='json'), ensure_ascii=False).encode('utf-8')
+
     def to_text_format(self) -> str:
         """
-        转换为文本格式输出
-        
+        转换为文本格式输出（结果按实例缓存）
+
         :return: 格式化的文本字符串
         """
-        text_lines = [
-            f"标题: {self.title}",
-            f"链接: {self.url}",
-            f"来源: {self.source_name}",
-            f"评分: {self.score}",
-            f"评论数: {self.comments_count}",
-            f"时间: {self.created_at.strftime('%Y-%m-%d %H:%M:%S')}",
-        ]
-        
+        if self._text_cache is not None:
+            return self._text_cache
+
+        # isoformat 是 C 实现，输出与原 strftime 格式一致
+        text = (
+            f"标题: {self.title}\n"
+            f"链接: {self.url}\n"
+            f"来源: {self.source_name}\n"
+            f"评分: {self.score}\n"
+            f"评论数: {self.comments_count}\n"
+            f"时间: {self.created_at.isoformat(' ', 'seconds')}"
+        )
+
         if self.content:
-            text_lines.append(f"内容: {self.content}")
-            
+            text += f"\n内容: {self.content}"
+
         if self.tags:
-            text_lines.append(f"标签: {', '.join(self.tags)}")
-            
-        text_lines.append("-" * 80)
-        
-        return "\n".join(text_lines)
+            text += f"\n标签: {', '.join(self.tags)}"
+
+        text += "\n" + "-" * 80
+
+        self._text_cache = text
+        return text
+
+    def to_utf8_bytes(self) -> bytes:
+        """
+        文本格式的UTF-8字节（结果按实例缓存）
+        报告写出直接消费字节片段，同一文章只编码一次
+
+        :return: UTF-8编码的文本字节
+        """
+        if self._bytes_cache is None:
+            self._bytes_cache = self.to_text_format().encode('utf-8')
+        return self._bytes_cache
 
 
 class CrawlResult(BaseModel):
@@ -82,8 +115,27 @@ class CrawlResult(BaseModel):
     success: bool = Field(True, description="是否成功")
     error_message: Optional[str] = Field(None, description="错误信息")
 
-    class Config:
-        """Pydantic配置"""
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    def to_json_bytes(self) -> bytes:
+        """
+        序列化为JSON字节
+        orjson 可用时走 Rust 实现（原生处理 datetime），否则回退标准库
+
+        :return: UTF-8编码的JSON字节
+        """
+        if _ORJSON_AVAILABLE:
+            return orjson.dumps(self.model_dump(), default=str)
+        return json.dumps(self.model_dump(mode='json'), ensure_ascii=False).encode('utf-8')
+
+    def to_text_bytes(self) -> bytes:
+        """
+        整批文章转换为UTF-8文本字节
+        单个bytearray累积全部内容，写文件时一次 write 即可落盘，
+        避免逐篇字符串拼接的反复重分配
+
+        :return: UTF-8编码的文本字节
+        """
+        buf = bytearray()
+        for article in self.articles:
+            buf += article.to_utf8_bytes()
+            buf += b"\n"
+        return bytes(buf)
\ No newline at end of file
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+轻量文章数据类
+抓取热路径上使用的无验证数据结构，外部I/O边界再转换为Pydantic模型
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from backend.models.article import ArticleModel
+
+
+@dataclass(slots=True)
+class Article:
+    """
+    文章数据类
+
+    字段与 ArticleModel 一一对应。解析器产出的字段是可信数据，
+    构造时跳过 Pydantic 验证；__slots__ 同时省去每实例的 __dict__
+
+    :param title: 文章标题
+    :param url: 文章链接
+    :param source_name: 抓取源名称
+    :param score: 文章评分/热度
+    :param comments_count: 评论数量
+    :param content: 文章内容
+    :param created_at: 创建时间
+    :param tags: 文章标签列表
+    """
+    title: str
+    url: str
+    source_name: str
+    score: int = 0
+    comments_count: int = 0
+    content: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    tags: List[str] = field(default_factory=list)
+
+    def to_pydantic(self) -> ArticleModel:
+        """
+        转换为带验证的 Pydantic 模型（外部I/O边界使用）
+
+        :return: ArticleModel 实例
+        """
+        return ArticleModel(
+            title=self.title,
+            content=self.content,
+            url=self.url,
+            source_name=self.source_name,
+            score=self.score,
+            comments_count=self.comments_count,
+            created_at=self.created_at,
+            tags=self.tags
+        )
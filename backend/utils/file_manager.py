@@ -4,14 +4,139 @@
 负责处理文件输出和管理
 """
 
+import mmap
 import os
+import time
 from typing import List, Optional
 from datetime import datetime
 from pathlib import Path
 import logging
 
+try:
+    import liburing
+    _LIBURING_AVAILABLE = True
+except ImportError:
+    liburing = None
+    _LIBURING_AVAILABLE = False
+
 from backend.models.article import ArticleModel, CrawlResult
 
+# 报告的固定片段，模块加载时编码一次，所有报告复用同一批不可变缓冲
+_BAR = ("=" * 80 + "\n").encode('utf-8')
+_TITLE = "IT资讯抓取报告\n".encode('utf-8')
+_BLANK = b"\n"
+# 报告以不带换行的分隔条收尾，与历史输出逐字节一致
+_FOOTER = _BAR + "报告结束\n".encode('utf-8') + b"=" * 80
+
+# 单次 writev 允许的最大分段数（POSIX IOV_MAX 下限为1024）
+_IOV_MAX = 1024
+
+
+def _write_iov(fd: int, iov: List[bytes]) -> None:
+    """
+    将字节分段列表写入文件描述符
+    支持 writev 时走 gather-I/O，由内核直接拼接各分段，
+    用户态不再构造完整的中间大缓冲；否则合并后单次 write
+
+    :param fd: 文件描述符
+    :param iov: 字节分段列表
+    """
+    if hasattr(os, 'writev'):
+        for i in range(0, len(iov), _IOV_MAX):
+            batch = list(iov[i:i + _IOV_MAX])
+            # writev 可能部分写出：丢弃写完的分段、截掉写了一半的前缀后重试
+            while batch:
+                written = os.writev(fd, batch)
+                while batch and written >= len(batch[0]):
+                    written -= len(batch[0])
+                    del batch[0]
+                if batch and written:
+                    batch[0] = batch[0][written:]
+    else:
+        view = memoryview(b"".join(iov))
+        while view:
+            view = view[os.write(fd, view):]
+
+
+# fdatasync 只刷数据不刷元数据，对追加写与 fsync 等效且更便宜；部分平台没有
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _unlink_batch(paths: List[str]) -> List[str]:
+    """
+    批量删除文件
+    liburing 可用时把全部 unlink 打包进一次 io_uring 提交，
+    N 个文件只付一次系统调用；否则逐个 os.unlink
+
+    :param paths: 待删除的文件路径列表
+    :return: 成功删除的路径列表
+    """
+    if _LIBURING_AVAILABLE and len(paths) > 1:
+        try:
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(len(paths), ring, 0)
+            try:
+                for path in paths:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_unlinkat(
+                        sqe, liburing.AT_FDCWD, path.encode(), 0
+                    )
+                liburing.io_uring_submit_and_wait(ring, len(paths))
+
+                deleted = []
+                cqe = liburing.io_uring_cqe()
+                for path in paths:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    if cqe.res == 0:
+                        deleted.append(path)
+                    liburing.io_uring_cqe_seen(ring, cqe)
+                return deleted
+            finally:
+                liburing.io_uring_queue_exit(ring)
+        except Exception:
+            # 内核/绑定不支持时退回逐个删除
+            pass
+
+    deleted = []
+    for path in paths:
+        try:
+            os.unlink(path)
+            deleted.append(path)
+        except OSError:
+            continue
+    return deleted
+
+
+class FileInfo:
+    """
+    文件信息
+    时间字段保存原始时间戳，datetime 对象在属性被访问时才构造：
+    批量列目录通常只看路径和大小，不用为每个文件付转换开销
+
+    :param path: 文件路径
+    :param stat: os.stat 结果
+    :param is_file: 是否为普通文件
+    """
+
+    __slots__ = ('path', 'size', 'is_file', '_ctime', '_mtime')
+
+    def __init__(self, path: str, stat: os.stat_result, is_file: bool):
+        self.path = path
+        self.size = stat.st_size
+        self.is_file = is_file
+        self._ctime = stat.st_ctime
+        self._mtime = stat.st_mtime
+
+    @property
+    def created_time(self) -> datetime:
+        """创建时间（延迟构造）"""
+        return datetime.fromtimestamp(self._ctime)
+
+    @property
+    def modified_time(self) -> datetime:
+        """修改时间（延迟构造）"""
+        return datetime.fromtimestamp(self._mtime)
+
 
 class FileManager:
     """
@@ -19,15 +144,22 @@ class FileManager:
     负责将抓取结果输出到文件
     """
     
-    def __init__(self, output_dir: str = "."):
+    def __init__(self, output_dir: str = ".", durability: str = 'none'):
         """
         初始化文件管理器
-        
+
         :param output_dir: 输出目录路径
+        :param durability: 落盘策略，'none'依赖内核回写 /
+            'batch'保存后攒着、flush_pending() 统一 fdatasync /
+            'sync'每次保存立即 fdatasync
         """
         self.output_dir = Path(output_dir)
+        self.durability = durability
         self.logger = logging.getLogger("file_manager")
-        
+
+        # batch 模式下待刷盘的文件描述符
+        self._pending_fds: List[int] = []
+
         # 确保输出目录存在
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -47,12 +179,32 @@ class FileManager:
             filename = self._generate_filename(result.source_name, result.crawl_time)
             filepath = self.output_dir / filename
             
-            # 写入文件
-            content = self._format_articles_to_text(result)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+            # 写入文件：预编码分段直接交给内核聚集写，绕过文本/缓冲层
+            iov = self._format_articles_to_text(result)
+
+            fd = os.open(str(filepath), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # 总长已知：预留连续extent，一次元数据操作替代边写边扩
+                if hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, sum(map(len, iov)))
+                    except OSError:
+                        # 个别文件系统不支持预分配，直接写入即可
+                        pass
+                _write_iov(fd, iov)
+                if self.durability == 'sync':
+                    # 每文件一次 journal 提交，吞吐最低但崩溃不丢数据
+                    _fdatasync(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+
+            if self.durability == 'batch':
+                # fd 留到 flush_pending() 统一刷盘，整批只付一次同步开销
+                self._pending_fds.append(fd)
+            else:
+                os.close(fd)
+
             self.logger.info(f"成功保存 {len(result.articles)} 篇文章到: {filepath}")
             return str(filepath)
             
@@ -60,6 +212,26 @@ class FileManager:
             self.logger.error(f"保存文件失败: {str(e)}")
             return None
     
+    def flush_pending(self) -> int:
+        """
+        刷盘所有待同步的文件
+        batch 模式下保存的文件在此统一 fdatasync 并关闭，
+        多个结果只付一次同步等待
+
+        :return: 刷盘的文件数量
+        """
+        flushed = 0
+        for fd in self._pending_fds:
+            try:
+                _fdatasync(fd)
+                flushed += 1
+            except OSError as e:
+                self.logger.error(f"文件刷盘失败: {str(e)}")
+            finally:
+                os.close(fd)
+        self._pending_fds.clear()
+        return flushed
+
     def _generate_filename(self, source_name: str, crawl_time: datetime) -> str:
         """
         生成输出文件名
@@ -72,37 +244,42 @@ class FileManager:
         time_str = crawl_time.strftime("%H%M%S")
         return f"{date_str}_{source_name}_{time_str}_news.txt"
     
-    def _format_articles_to_text(self, result: CrawlResult) -> str:
+    def _format_articles_to_text(self, result: CrawlResult) -> List[bytes]:
         """
-        将文章列表格式化为文本
-        
+        将文章列表格式化为UTF-8字节分段列表
+        每段只编码一次，不在用户态拼接成完整大字符串；
+        分段列表直接作为 writev 的 iovec 交给内核聚集写
+
         :param result: 抓取结果
-        :return: 格式化的文本内容
+        :return: 预编码的字节分段列表
         """
-        lines = []
-        
-        # 添加头部信息
-        lines.append("=" * 80)
-        lines.append(f"IT资讯抓取报告")
-        lines.append("=" * 80)
-        lines.append(f"抓取源: {result.source_name}")
-        lines.append(f"抓取时间: {result.crawl_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"文章总数: {result.total_count}")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # 添加文章内容
+        chunks = []
+        append = chunks.append
+
+        # 头部信息
+        append(_BAR)
+        append(_TITLE)
+        append(_BAR)
+        append(
+            (
+                f"抓取源: {result.source_name}\n"
+                f"抓取时间: {result.crawl_time.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"文章总数: {result.total_count}\n"
+            ).encode('utf-8')
+        )
+        append(_BAR)
+        append(_BLANK)
+
+        # 文章内容（文章字节在模型上按实例缓存，这里不再重复编码）
         for i, article in enumerate(result.articles, 1):
-            lines.append(f"【文章 {i}】")
-            lines.append(article.to_text_format())
-            lines.append("")
-        
-        # 添加尾部信息
-        lines.append("=" * 80)
-        lines.append("报告结束")
-        lines.append("=" * 80)
-        
-        return "\n".join(lines)
+            append(f"【文章 {i}】\n".encode('utf-8'))
+            append(article.to_utf8_bytes())
+            append(b"\n\n")
+
+        # 尾部信息
+        append(_FOOTER)
+
+        return chunks
     
     def get_output_files(self, source_name: Optional[str] = None) -> List[str]:
         """
@@ -112,15 +289,22 @@ class FileManager:
         :return: 文件路径列表
         """
         try:
-            pattern = "*_news.txt"
-            if source_name:
-                pattern = f"*_{source_name}_*_news.txt"
-            
-            files = list(self.output_dir.glob(pattern))
-            files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            return [str(f) for f in files]
-            
+            # scandir 的 DirEntry.stat() 复用目录读取时缓存的元数据，
+            # 比 glob+Path.stat() 每个文件少一次 stat 系统调用
+            marker = f"_{source_name}_" if source_name else None
+            entries = []
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.endswith("_news.txt"):
+                        continue
+                    if marker is not None and marker not in name:
+                        continue
+                    entries.append((entry.stat().st_mtime, entry.path))
+
+            entries.sort(reverse=True)
+            return [path for _, path in entries]
+
         except Exception as e:
             self.logger.error(f"获取输出文件列表失败: {str(e)}")
             return []
@@ -133,42 +317,66 @@ class FileManager:
         :return: 删除的文件数量
         """
         try:
-            cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
-            deleted_count = 0
-            
-            for file_path in self.output_dir.glob("*_news.txt"):
-                if file_path.stat().st_mtime < cutoff_time:
-                    file_path.unlink()
-                    deleted_count += 1
-                    self.logger.info(f"删除旧文件: {file_path}")
-            
-            return deleted_count
-            
+            # time.time() 直接取秒，不经过 datetime 构造和时区推导
+            cutoff_time = time.time() - days * 86400
+
+            # 先用缓存的stat筛出待删文件，再整批删除
+            victims = []
+            with os.scandir(self.output_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith("_news.txt"):
+                        continue
+                    if entry.stat().st_mtime < cutoff_time:
+                        victims.append(entry.path)
+
+            deleted = _unlink_batch(victims)
+            for path in deleted:
+                self.logger.info(f"删除旧文件: {path}")
+
+            return len(deleted)
+
         except Exception as e:
             self.logger.error(f"清理旧文件失败: {str(e)}")
             return 0
     
-    def get_file_info(self, filepath: str) -> Optional[dict]:
+    def open_report(self, filepath: str) -> Optional[mmap.mmap]:
+        """
+        以内存映射方式打开报告文件
+        内容由操作系统按需换页，读取不经过用户态缓冲拷贝；
+        切片或 memoryview 可直接喂给解析器/socket 做零拷贝消费。
+        映射建立后文件描述符即可关闭，调用方负责 close() 映射
+
+        :param filepath: 报告文件路径
+        :return: 只读内存映射或None
+        """
+        try:
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+            return mm
+
+        except (OSError, ValueError) as e:
+            self.logger.error(f"打开报告文件失败 {filepath}: {str(e)}")
+            return None
+
+    def get_file_info(self, filepath: str) -> Optional[FileInfo]:
         """
         获取文件信息
-        
+
         :param filepath: 文件路径
-        :return: 文件信息字典或None
+        :return: 文件信息对象或None
         """
         try:
             path = Path(filepath)
             if not path.exists():
                 return None
-            
+
             stat = path.stat()
-            return {
-                "path": str(path),
-                "size": stat.st_size,
-                "created_time": datetime.fromtimestamp(stat.st_ctime),
-                "modified_time": datetime.fromtimestamp(stat.st_mtime),
-                "is_file": path.is_file()
-            }
-            
+            return FileInfo(str(path), stat, path.is_file())
+
         except Exception as e:
             self.logger.error(f"获取文件信息失败 {filepath}: {str(e)}")
             return None
\ No newline at end of file
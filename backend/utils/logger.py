@@ -4,13 +4,173 @@
 负责配置和管理系统日志
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import types
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+try:
+    import liburing
+    _LIBURING_AVAILABLE = True
+except ImportError:
+    liburing = None
+    _LIBURING_AVAILABLE = False
+
+# io_uring 提交队列深度
+_URING_QUEUE_DEPTH = 64
+
+# 级别名 -> 数值的只读映射，免去每次 getattr 的属性查找
+_LEVELS = types.MappingProxyType({
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+})
+
+
+class _CountingFileHandler(logging.Handler):
+    """
+    追加写日志文件处理器
+    RotatingFileHandler 每条记录都 stat 文件判断是否滚动；
+    这里以进程内计数器跟踪已写字节，越过阈值时才做一次 rename 滚动，
+    每条记录只剩一次 write 系统调用
+
+    :param filename: 日志文件路径
+    :param maxBytes: 滚动阈值字节数，0表示不滚动
+    :param backupCount: 保留的历史文件数
+    """
+
+    def __init__(self, filename, maxBytes: int = 0, backupCount: int = 0):
+        super().__init__()
+        self.baseFilename = str(filename)
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self._fd = os.open(self.baseFilename,
+                           os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        # 追加模式下从当前文件大小起算，进程重启后阈值依然正确
+        self._written = os.fstat(self._fd).st_size
+
+        # liburing 可用时日志落盘走 io_uring 异步提交：
+        # 写出只是把缓冲送进环，磁盘延迟不再阻塞日志线程
+        self._ring = None
+        self._inflight = []
+        if _LIBURING_AVAILABLE:
+            try:
+                ring = liburing.io_uring()
+                liburing.io_uring_queue_init(_URING_QUEUE_DEPTH, ring, 0)
+                self._ring = ring
+            except Exception:
+                self._ring = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        写出一条日志记录（handle() 已持有处理器锁）
+
+        :param record: 日志记录
+        """
+        try:
+            buf = (self.format(record) + '\n').encode('utf-8')
+            if self.maxBytes > 0 and self._written + len(buf) >= self.maxBytes:
+                self._rollover()
+            self._write(buf)
+            self._written += len(buf)
+        except Exception:
+            self.handleError(record)
+
+    def _write(self, buf: bytes) -> None:
+        """
+        写出一段字节，优先走 io_uring 异步提交
+
+        :param buf: 已格式化的日志字节
+        """
+        if self._ring is None:
+            os.write(self._fd, buf)
+            return
+
+        try:
+            # io_uring 不保证并发SQE的完成顺序，同一时刻只留一笔在途：
+            # 行序有保障，记录格式化仍可与上一笔磁盘写重叠
+            if self._inflight:
+                self._reap()
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            iov = liburing.iovec(buf)
+            # offset=-1: 按 O_APPEND 语义追加；缓冲在完成前必须保持存活
+            liburing.io_uring_prep_writev(sqe, self._fd, iov, 1, -1)
+            liburing.io_uring_submit(self._ring)
+            self._inflight.append((buf, iov))
+        except Exception:
+            # 环异常时退回同步写，并停用异步路径
+            self._drain_ring()
+            os.write(self._fd, buf)
+
+    def _reap(self) -> None:
+        """
+        收割在途写入的完成事件并校验结果
+        写失败或短写时同步补写，日志行不会静默丢失
+        """
+        cqe = liburing.io_uring_cqe()
+        for buf, _iov in self._inflight:
+            liburing.io_uring_wait_cqe(self._ring, cqe)
+            res = cqe.res
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+            if res < 0:
+                os.write(self._fd, buf)
+            elif res < len(buf):
+                os.write(self._fd, buf[res:])
+        self._inflight.clear()
+
+    def _drain_ring(self) -> None:
+        """
+        等待在途写入完成并关闭 io_uring 环
+        """
+        if self._ring is None:
+            return
+        try:
+            self._reap()
+            liburing.io_uring_queue_exit(self._ring)
+        except Exception:
+            pass
+        self._ring = None
+        self._inflight.clear()
+
+    def _rollover(self) -> None:
+        """
+        滚动日志文件：关闭当前文件，历史文件依次后移一位
+        """
+        # 关闭前确保在途异步写已落到旧文件
+        if self._ring is not None and self._inflight:
+            self._reap()
+        os.close(self._fd)
+        if self.backupCount > 0:
+            for i in range(self.backupCount - 1, 0, -1):
+                src = f"{self.baseFilename}.{i}"
+                if os.path.exists(src):
+                    os.replace(src, f"{self.baseFilename}.{i + 1}")
+            os.replace(self.baseFilename, f"{self.baseFilename}.1")
+
+        self._fd = os.open(self.baseFilename,
+                           os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND,
+                           0o644)
+        self._written = 0
+
+    def close(self) -> None:
+        """
+        关闭处理器持有的文件描述符
+        """
+        try:
+            self._drain_ring()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            super().close()
+
 
 class LoggerManager:
     """
@@ -26,62 +186,90 @@ class LoggerManager:
         :param log_level: 日志级别
         """
         self.log_dir = Path(log_dir)
-        self.log_level = getattr(logging, log_level.upper(), logging.INFO)
-        
+        self.log_level = _LEVELS.get(log_level.upper(), logging.INFO)
+
+        # 格式串不含线程/进程/源文件字段，关掉每条记录的对应采集：
+        # 省去 threading/os.getpid 查询和 %(filename)s 需要的栈回溯
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        logging._srcfile = None
+
         # 创建日志目录
         self.log_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # 配置日志
         self._setup_logging()
     
     def _setup_logging(self) -> None:
         """
         配置日志系统
+        真正的控制台/文件处理器挂在后台 QueueListener 线程上，
+        调用方日志器只入队：热路径上的 logger.info 不再付出写文件
+        和滚动检查的同步开销
         """
+        # 重复初始化时先停掉旧的监听线程
+        self._stop_listener()
+
         # 创建根日志器
         root_logger = logging.getLogger()
         root_logger.setLevel(self.log_level)
-        
+
         # 清除现有处理器
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
-        
-        # 创建格式器
+
+        # 创建格式器（格式串固定，跳过构造时的校验）
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            validate=False
         )
-        
+
         # 控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setLevel(self.log_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
-        
+
         # 文件处理器 - 主日志文件
         main_log_file = self.log_dir / "crawler.log"
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _CountingFileHandler(
             main_log_file,
             maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
+            backupCount=5
         )
         file_handler.setLevel(self.log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
-        
+
         # 错误日志文件
         error_log_file = self.log_dir / "error.log"
-        error_handler = logging.handlers.RotatingFileHandler(
+        error_handler = _CountingFileHandler(
             error_log_file,
             maxBytes=5*1024*1024,  # 5MB
-            backupCount=3,
-            encoding='utf-8'
+            backupCount=3
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        root_logger.addHandler(error_handler)
-    
+
+        # 队列管道：根日志器只挂 QueueHandler，真实处理器由监听线程驱动
+        self._log_queue = queue.SimpleQueue()
+        self._sink_handlers = [console_handler, file_handler, error_handler]
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, *self._sink_handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._stop_listener)
+
+        root_logger.addHandler(logging.handlers.QueueHandler(self._log_queue))
+
+    def _stop_listener(self) -> None:
+        """
+        停止日志监听线程（排空队列后再退出）
+        """
+        listener = getattr(self, '_listener', None)
+        if listener is not None and listener._thread is not None:
+            listener.stop()
+
     def get_logger(self, name: str) -> logging.Logger:
         """
         获取指定名称的日志器
@@ -110,22 +298,24 @@ class LoggerManager:
         
         formatter = logging.Formatter(
             '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
+            datefmt='%Y-%m-%d %H:%M:%S',
+            validate=False
         )
         
         # 文件处理器
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = _CountingFileHandler(
             crawler_log_file,
             maxBytes=5*1024*1024,  # 5MB
-            backupCount=3,
-            encoding='utf-8'
+            backupCount=3
         )
         file_handler.setLevel(self.log_level)
         file_handler.setFormatter(formatter)
         
         logger.addHandler(file_handler)
         logger.setLevel(self.log_level)
-        
+        # 不再向根日志器冒泡：同一条记录只格式化/写出一次
+        logger.propagate = False
+
         return logger
     
     def cleanup_old_logs(self, days: int = 30) -> int:
@@ -171,15 +361,17 @@ class LoggerManager:
         :param level: 日志级别字符串
         """
         try:
-            new_level = getattr(logging, level.upper(), logging.INFO)
+            new_level = _LEVELS.get(level.upper(), logging.INFO)
             self.log_level = new_level
-            
+
             # 更新所有处理器的日志级别
             root_logger = logging.getLogger()
             root_logger.setLevel(new_level)
-            
-            for handler in root_logger.handlers:
-                if not isinstance(handler, logging.handlers.RotatingFileHandler) or "error.log" not in str(handler.baseFilename):
+
+            # 真实处理器挂在监听线程上，错误日志文件固定保持ERROR级别
+            # baseFilename 本身就是str，无需再转换
+            for handler in getattr(self, '_sink_handlers', []):
+                if "error.log" not in getattr(handler, 'baseFilename', ''):
                     handler.setLevel(new_level)
                     
         except Exception as e:
@@ -6,7 +6,8 @@ IT资讯抓取系统主程序
 """
 
 import sys
-import argparse
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pathlib import Path
 
@@ -16,8 +17,19 @@ sys.path.insert(0, str(Path(__file__).parent))
 from backend.config.settings import settings
 from backend.utils.logger import logger_manager
 from backend.utils.file_manager import FileManager
-from backend.crawlers.crawler_factory import CrawlerFactory
-from backend.crawlers.hackernews_crawler import HackerNewsCrawler
+
+
+@lru_cache(maxsize=32)
+def _get_base_config(crawler_name: str) -> MappingProxyType:
+    """
+    获取抓取器基础配置（按名称缓存的只读视图）
+    反复运行同一抓取器时不再重建配置字典；
+    调用方先复制再合并命令行覆盖项，基础配置不会被改写
+
+    :param crawler_name: 抓取器名称
+    :return: 只读配置映射
+    """
+    return MappingProxyType(settings.get_crawler_config(crawler_name))
 
 
 class NewsAggregator:
@@ -35,23 +47,10 @@ class NewsAggregator:
         
         # 初始化文件管理器
         self.file_manager = FileManager(settings.OUTPUT_DIR)
-        
-        # 注册抓取器
-        self._register_crawlers()
-        
+
+        # 抓取器由工厂按名称延迟加载，无需在此注册
         self.logger.info("IT资讯抓取系统初始化完成")
-    
-    def _register_crawlers(self) -> None:
-        """
-        注册所有可用的抓取器
-        """
-        try:
-            CrawlerFactory.register_crawler("hackernews", HackerNewsCrawler)
-            self.logger.info("抓取器注册完成")
-        except Exception as e:
-            self.logger.error(f"抓取器注册失败: {str(e)}")
-            raise
-    
+
     def run_crawler(self, crawler_name: str, config: Optional[Dict[str, Any]] = None) -> bool:
         """
         运行指定的抓取器
@@ -60,11 +59,14 @@ class NewsAggregator:
         :param config: 可选的配置参数
         :return: 是否成功
         """
+        # 工厂只在真正抓取时导入，config/cleanup 等命令不付这笔导入开销
+        from backend.crawlers.crawler_factory import CrawlerFactory
+
         try:
             self.logger.info(f"开始运行抓取器: {crawler_name}")
             
-            # 获取抓取器配置
-            crawler_config = settings.get_crawler_config(crawler_name)
+            # 获取抓取器配置：缓存的基础配置上写时复制，命令行覆盖项只改副本
+            crawler_config = dict(_get_base_config(crawler_name))
             if config:
                 crawler_config.update(config)
             
@@ -89,6 +91,8 @@ class NewsAggregator:
                 
                 # 保存结果
                 output_file = self.file_manager.save_crawl_result(result)
+                # batch 落盘模式下此处统一刷盘（其它模式为空操作）
+                self.file_manager.flush_pending()
                 if output_file:
                     self.logger.info(f"抓取完成，结果已保存到: {output_file}")
                     print(f"✅ 抓取完成！结果已保存到: {output_file}")
@@ -107,6 +111,8 @@ class NewsAggregator:
         """
         列出所有可用的抓取器
         """
+        from backend.crawlers.crawler_factory import CrawlerFactory
+
         crawlers = CrawlerFactory.get_available_crawlers()
         
         print("📋 可用的抓取器:")
@@ -160,16 +166,21 @@ class NewsAggregator:
             print(f"❌ 清理失败: {str(e)}")
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
-    """
-    创建命令行参数解析器
-    
-    :return: 参数解析器
-    """
-    parser = argparse.ArgumentParser(
-        description="IT资讯抓取系统",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_USAGE = """IT资讯抓取系统
+
+用法: python main.py <命令> [选项]
+
+可用命令:
+  run <crawler>        运行抓取器
+      --delay N            请求间延迟秒数
+      --max-pages N        最大抓取页数
+      --fetch-content      是否抓取文章内容
+      --timeout N          请求超时时间
+  list                 列出所有可用抓取器
+  config               显示当前配置
+  cleanup              清理旧文件
+      --days N             保留天数
+
 示例用法:
   python main.py run hackernews                    # 运行Hacker News抓取器
   python main.py run hackernews --delay 2          # 设置请求延迟为2秒
@@ -177,30 +188,80 @@ def create_argument_parser() -> argparse.ArgumentParser:
   python main.py config                            # 显示当前配置
   python main.py cleanup                           # 清理旧文件
   python main.py cleanup --days 7                  # 清理7天前的文件
-        """
-    )
-    
-    subparsers = parser.add_subparsers(dest='command', help='可用命令')
-    
-    # run 命令
-    run_parser = subparsers.add_parser('run', help='运行抓取器')
-    run_parser.add_argument('crawler', help='抓取器名称')
-    run_parser.add_argument('--delay', type=int, help='请求间延迟秒数')
-    run_parser.add_argument('--max-pages', type=int, help='最大抓取页数')
-    run_parser.add_argument('--fetch-content', action='store_true', help='是否抓取文章内容')
-    run_parser.add_argument('--timeout', type=int, help='请求超时时间')
-    
-    # list 命令
-    subparsers.add_parser('list', help='列出所有可用抓取器')
-    
-    # config 命令
-    subparsers.add_parser('config', help='显示当前配置')
-    
-    # cleanup 命令
-    cleanup_parser = subparsers.add_parser('cleanup', help='清理旧文件')
-    cleanup_parser.add_argument('--days', type=int, help='保留天数')
-    
-    return parser
+"""
+
+
+def _cmd_run(aggregator: NewsAggregator, argv: list) -> None:
+    """
+    run 命令：解析自身选项并运行抓取器
+
+    :param aggregator: 新闻聚合器实例
+    :param argv: 命令自身的参数列表
+    """
+    # argparse 只在真正需要选项解析的分支里构建
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='main.py run', description='运行抓取器')
+    parser.add_argument('crawler', help='抓取器名称')
+    parser.add_argument('--delay', type=int, help='请求间延迟秒数')
+    parser.add_argument('--max-pages', type=int, help='最大抓取页数')
+    parser.add_argument('--fetch-content', action='store_true', help='是否抓取文章内容')
+    parser.add_argument('--timeout', type=int, help='请求超时时间')
+    args = parser.parse_args(argv)
+
+    # 构建配置参数
+    config = {}
+    if args.delay is not None:
+        config['delay'] = args.delay
+    if args.max_pages is not None:
+        config['max_pages'] = args.max_pages
+    if args.fetch_content:
+        config['fetch_content'] = True
+    if args.timeout is not None:
+        config['timeout'] = args.timeout
+
+    # 运行抓取器
+    success = aggregator.run_crawler(args.crawler, config if config else None)
+    sys.exit(0 if success else 1)
+
+
+def _cmd_list(aggregator: NewsAggregator, argv: list) -> None:
+    """
+    list 命令：列出所有可用抓取器
+    """
+    aggregator.list_crawlers()
+
+
+def _cmd_config(aggregator: NewsAggregator, argv: list) -> None:
+    """
+    config 命令：显示当前配置
+    """
+    aggregator.show_config()
+
+
+def _cmd_cleanup(aggregator: NewsAggregator, argv: list) -> None:
+    """
+    cleanup 命令：清理旧文件
+
+    :param aggregator: 新闻聚合器实例
+    :param argv: 命令自身的参数列表
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='main.py cleanup', description='清理旧文件')
+    parser.add_argument('--days', type=int, help='保留天数')
+    args = parser.parse_args(argv)
+
+    aggregator.cleanup_files(args.days)
+
+
+# 命令名 -> 处理函数的分发表，冷启动不再构建整棵 argparse 子解析器树
+_COMMANDS = {
+    'run': _cmd_run,
+    'list': _cmd_list,
+    'config': _cmd_config,
+    'cleanup': _cmd_cleanup,
+}
 
 
 def main():
@@ -208,43 +269,24 @@ def main():
     主函数
     """
     try:
-        # 解析命令行参数
-        parser = create_argument_parser()
-        args = parser.parse_args()
-        
-        if not args.command:
-            parser.print_help()
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+
+        if command is None or command in ('-h', '--help'):
+            print(_USAGE)
             return
-        
+
+        handler = _COMMANDS.get(command)
+        if handler is None:
+            print(f"❌ 未知命令: {command}")
+            print(_USAGE)
+            sys.exit(1)
+
         # 创建新闻聚合器实例
         aggregator = NewsAggregator()
-        
+
         # 执行相应命令
-        if args.command == 'run':
-            # 构建配置参数
-            config = {}
-            if args.delay is not None:
-                config['delay'] = args.delay
-            if args.max_pages is not None:
-                config['max_pages'] = args.max_pages
-            if args.fetch_content:
-                config['fetch_content'] = True
-            if args.timeout is not None:
-                config['timeout'] = args.timeout
-            
-            # 运行抓取器
-            success = aggregator.run_crawler(args.crawler, config if config else None)
-            sys.exit(0 if success else 1)
-            
-        elif args.command == 'list':
-            aggregator.list_crawlers()
-            
-        elif args.command == 'config':
-            aggregator.show_config()
-            
-        elif args.command == 'cleanup':
-            aggregator.cleanup_files(args.days)
-            
+        handler(aggregator, sys.argv[2:])
+
     except KeyboardInterrupt:
         print("\n⚠️  用户中断操作")
         sys.exit(1)